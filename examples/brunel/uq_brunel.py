@@ -12,16 +12,20 @@ from brunel import brunel_network
 model = un.NestModel(run=brunel_network, ignore=True)
 
 
+# The delay has the same distribution in both states,
+# so the distribution is created once and shared
+delay = cp.Uniform(1.5, 3)
+
 # Parametes for the synchronous regular (SR) state
 parameters = {"eta": cp.Uniform(1.5, 3.5),
               "g": cp.Uniform(1, 3),
-              "delay": cp.Uniform(1.5, 3)}
+              "delay": delay}
 parameters_SR = un.Parameters(parameters)
 
 # Parameter for the asynchronous irregular (AI) state
 parameters = {"eta": cp.Uniform(1.5, 2.2),
               "g": cp.Uniform(5, 8),
-              "delay": cp.Uniform(1.5, 3)}
+              "delay": delay}
 parameters_AI = un.Parameters(parameters)
 
 # Initialize network features
@@ -34,9 +38,11 @@ UQ = un.UncertaintyQuantification(model,
 
 # Perform uncertainty quantification
 # and save the data and plots under their own name
-# We set the seed to easier be able to reproduce the result
+# The collocation nodes are chosen with Sobol sampling, and
+# we set the seed to easier be able to reproduce the result
 UQ.quantify(figure_folder="figures_brunel_SR",
             filename="brunel_SR",
+            sampling_rule="S",
             seed=10)
 
 
@@ -45,7 +51,9 @@ UQ.parameters = parameters_AI
 
 # Perform uncertainty quantification on the new parameter set
 # and save the data and plots under their own name
-# We set the seed to easier be able to reproduce the result
+# The collocation nodes are chosen with Sobol sampling, and
+# we set the seed to easier be able to reproduce the result
 data = UQ.quantify(figure_folder="figures_brunel_AI",
                    filename="brunel_AI",
+                   sampling_rule="S",
                    seed=10)
\ No newline at end of file
@@ -228,6 +228,39 @@ class Parallel(Base):
 
 
 
+    def to_array(self, values):
+        """
+        Convert a regular list of numbers to a numpy array.
+
+        Numpy arrays are stored contiguously, and are considerably cheaper to
+        send between processes than nested lists of numbers.
+
+        Parameters
+        ----------
+        values : {array_like, list, number}
+            Model or feature values or time.
+
+        Returns
+        -------
+        values : {array, list, number}
+            `values` as a numpy array if `values` is a regular list or tuple
+            of numbers, otherwise `values` unchanged.
+        """
+        if not isinstance(values, (list, tuple)):
+            return values
+
+        try:
+            values_array = np.array(values)
+        except ValueError:
+            return values
+
+        if values_array.dtype.kind not in "biufc":
+            return values
+
+        return values_array
+
+
+
     def run(self, model_parameters):
         """
         Run a model and calculate features from the model output,
@@ -307,8 +340,8 @@ class Parallel(Base):
 
                 time_postprocess, values_postprocess = postprocess_result
 
-            values_postprocess = none_to_nan(values_postprocess)
-            time_postprocess = none_to_nan(time_postprocess)
+            values_postprocess = self.to_array(none_to_nan(values_postprocess))
+            time_postprocess = self.to_array(none_to_nan(time_postprocess))
 
             results[self.model.name] = {"time": time_postprocess,
                                         "values": values_postprocess}
@@ -331,8 +364,8 @@ class Parallel(Base):
                 time_feature = feature_results[feature]["time"]
                 values_feature = feature_results[feature]["values"]
 
-                time_feature = none_to_nan(time_feature)
-                values_feature = none_to_nan(values_feature)
+                time_feature = self.to_array(none_to_nan(time_feature))
+                values_feature = self.to_array(none_to_nan(values_feature))
 
                 results[feature] = {"values": values_feature,
                                     "time": time_feature}
@@ -351,3 +384,35 @@ class Parallel(Base):
             print("")
             raise
 
+
+    def run_indexed(self, indexed_model_parameters):
+        """
+        Run a model and calculate features from the model output for one
+        indexed set of model parameters, return the index together with the
+        results.
+
+        Used when the model is evaluated in parallel and the results arrive in
+        an arbitrary order, so they can be returned in the order of the model
+        parameters.
+
+        Parameters
+        ----------
+        indexed_model_parameters : tuple
+            A tuple ``(index, model_parameters)``, where `model_parameters` is
+            a dictionary with all model parameters. These parameters are sent
+            to model.run().
+
+        Returns
+        -------
+        index : int
+            The index of the set of model parameters.
+        result : dictionary
+            The model and feature results, see Parallel.run.
+
+        See also
+        --------
+        uncertainpy.core.Parallel.run
+        """
+        index, model_parameters = indexed_model_parameters
+
+        return index, self.run(model_parameters)
@@ -1,8 +1,14 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import os
 import warnings
+import atexit
+import collections
+import contextlib
+import uuid
 import six
 
+
 try:
     from itertools import imap
 except ImportError:
@@ -10,6 +16,20 @@ except ImportError:
 
 from tqdm import tqdm
 import numpy as np
+import scipy.interpolate as scpi
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+    from multiprocessing import resource_tracker
+except ImportError:
+    SharedMemory = None
+
+try:
+    from _posixshmem import shm_unlink
+except ImportError:
+    shm_unlink = None
+
+from multiprocess.pool import ExceptionWithTraceback
 
 try:
     from xvfbwrapper import Xvfb
@@ -25,6 +45,243 @@ from .base import ParameterBase
 from .parallel import Parallel
 
 
+# The Parallel object of each worker process, set once when the worker starts
+_worker_parallel = None
+
+
+@contextlib.contextmanager
+def _display(display=None):
+    """
+    Use `display` as the X display, the ``DISPLAY`` environment variable,
+    inside a with block, and restore the previous display afterwards.
+
+    Parameters
+    ----------
+    display : {None, str}, optional
+        The display to use, for example ``":1"``. If None, the display is not
+        changed, only restored afterwards.
+        Default is None.
+    """
+    previous_display = os.environ.get("DISPLAY")
+
+    if display is not None:
+        os.environ["DISPLAY"] = display
+
+    try:
+        yield
+    finally:
+        if previous_display is None:
+            os.environ.pop("DISPLAY", None)
+        else:
+            os.environ["DISPLAY"] = previous_display
+
+# Arrays smaller than this (in bytes) are cheaper to pickle than to send
+# through shared memory
+_shared_memory_threshold = 2**20
+
+# Prefix of the names of the shared memory created by the workers of the
+# current evaluation, set once when the worker starts
+_shared_memory_prefix = None
+
+
+def _shared_memory_name(prefix, index, number):
+    """
+    Name of the shared memory for array number `number` of the result with
+    index `index`. The names are known in advance, so the main process can
+    free shared memory from results it never received.
+    """
+    return "{}_{}_{}".format(prefix, index, number)
+
+
+def _unlink_shared_memory(name):
+    """
+    Free the shared memory with `name`, if it exists.
+
+    Notes
+    -----
+    The shared memory is unlinked by name without opening it, so shared
+    memory a worker was interrupted while creating is also freed. On
+    systems without POSIX shared memory, the shared memory is freed when the
+    worker processes exit.
+    """
+    if shm_unlink is None:
+        return
+
+    try:
+        shm_unlink("/" + name)
+    except FileNotFoundError:
+        pass
+
+
+class _SharedArray(object):
+    """
+    Copy an array into shared memory, so only a reference to it is pickled
+    when the array is sent from a worker process to the main process.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        The array to share.
+    name : str
+        Name of the shared memory.
+
+    Notes
+    -----
+    The shared memory is owned by the process that calls `load`, which frees
+    the shared memory after copying the array out of it.
+    """
+    def __init__(self, array, name):
+        self.shape = array.shape
+        self.dtype = array.dtype.str
+        self.name = name
+
+        shared_memory = SharedMemory(name=name, create=True, size=array.nbytes)
+
+        # The worker must not free the shared memory when it exits
+        resource_tracker.unregister(shared_memory._name, "shared_memory")
+
+        np.ndarray(self.shape, dtype=self.dtype, buffer=shared_memory.buf)[...] = array
+        shared_memory.close()
+
+
+    def load(self):
+        """
+        Copy the array out of shared memory and free the shared memory.
+
+        Returns
+        -------
+        array : numpy.ndarray
+            The shared array.
+        """
+        shared_memory = SharedMemory(name=self.name)
+
+        shared_array = np.ndarray(self.shape, dtype=self.dtype, buffer=shared_memory.buf)
+        array = shared_array.copy()
+        del shared_array
+
+        shared_memory.close()
+        shared_memory.unlink()
+
+        return array
+
+
+def _share_arrays(result, index):
+    """
+    Replace the large arrays in a model or feature result with references to
+    copies of them in shared memory.
+
+    Parameters
+    ----------
+    result : dictionary
+        The model and feature results, see Parallel.run.
+    index : int
+        The index of the set of model parameters, used to name the shared
+        memory.
+
+    Returns
+    -------
+    result : dictionary
+        The results, where each large ``"values"`` and ``"time"`` array is
+        replaced by a _SharedArray.
+    """
+    if SharedMemory is None or _shared_memory_prefix is None:
+        return result
+
+    number = 0
+    for feature in result:
+        for key in ["values", "time"]:
+            array = result[feature].get(key)
+
+            if isinstance(array, np.ndarray) and not array.dtype.hasobject \
+                    and array.nbytes >= _shared_memory_threshold:
+                name = _shared_memory_name(_shared_memory_prefix, index, number)
+                result[feature][key] = _SharedArray(array, name)
+                number += 1
+
+    return result
+
+
+def _load_arrays(result):
+    """
+    Replace the references to arrays in shared memory with the arrays.
+
+    Parameters
+    ----------
+    result : dictionary
+        The model and feature results, as returned by `_share_arrays`.
+
+    Returns
+    -------
+    result : dictionary
+        The results with each _SharedArray replaced by its array.
+    """
+    for feature in result:
+        for key in ["values", "time"]:
+            if isinstance(result[feature].get(key), _SharedArray):
+                result[feature][key] = result[feature][key].load()
+
+    return result
+
+
+def _init_worker(parallel, shared_memory_threshold=None, shared_memory_prefix=None):
+    """
+    Store `parallel` in the worker process, so the model and features are only
+    sent once to each worker instead of once for each task.
+
+    Parameters
+    ----------
+    parallel : Parallel
+        The Parallel object used to evaluate the model and features.
+    shared_memory_threshold : {None, int}, optional
+        The size in bytes above which arrays are sent through shared memory.
+        If None, the default of the worker is used.
+        Default is None.
+    shared_memory_prefix : {None, str}, optional
+        Prefix of the names of the shared memory. If None, no arrays are sent
+        through shared memory.
+        Default is None.
+    """
+    global _worker_parallel, _shared_memory_threshold, _shared_memory_prefix
+    _worker_parallel = parallel
+    _shared_memory_prefix = shared_memory_prefix
+
+    if shared_memory_threshold is not None:
+        _shared_memory_threshold = shared_memory_threshold
+
+
+def _run_worker(indexed_model_parameters):
+    """
+    Run the model and calculate the features in a worker process, using the
+    Parallel object stored by `_init_worker`.
+
+    Parameters
+    ----------
+    indexed_model_parameters : tuple
+        A tuple ``(index, model_parameters)``, see Parallel.run_indexed.
+
+    Returns
+    -------
+    index : int
+        The index of the set of model parameters.
+    result : {dictionary, Exception}
+        The model and feature results, see Parallel.run. Large arrays are
+        sent through shared memory, see `_share_arrays`. If the evaluation
+        fails, the exception is returned instead.
+
+    Notes
+    -----
+    Exceptions are returned instead of raised, since an exception discards
+    the results of every task sent to the worker in the same chunk. The
+    shared memory of those results would never be freed.
+    """
+    index = indexed_model_parameters[0]
+
+    try:
+        index, result = _worker_parallel.run_indexed(indexed_model_parameters)
+        return index, _share_arrays(result, index)
+    except Exception as error:
+        return index, ExceptionWithTraceback(error, error.__traceback__)
+
 
 class RunModel(ParameterBase):
     """
@@ -101,6 +358,10 @@ class RunModel(ParameterBase):
                                   features=features,
                                   logger_level=logger_level)
 
+        # Virtual display used when the model graphics is suppressed.
+        # Started the first time it is needed, and stopped by close
+        self._vdisplay = None
+
         super(RunModel, self).__init__(model=model,
                                        parameters=parameters,
                                        features=features,
@@ -161,8 +422,9 @@ class RunModel(ParameterBase):
         -------
         time : array_like
             The time array with the greatest number of time steps.
-        interpolated_results : list
-            A list containing all interpolated model/features results.
+        interpolated_results : array
+            An array with shape ``(len(results), len(time))`` containing all
+            interpolated model/features results.
             Interpolated at the points of the time results with the greatest
             number of time steps.
 
@@ -171,6 +433,9 @@ class RunModel(ParameterBase):
         Chooses the time array with the highest number of time points and use
         this time array to interpolate the model/feature results in each of
         those points. If an interpolation is None, gives numpy.nan instead.
+        The interpolated results are written directly into a preallocated
+        array. Splines with the same knots, which is the case for results with
+        the same time points, are evaluated together in a single call.
         """
         logger = get_logger(self)
 
@@ -181,20 +446,51 @@ class RunModel(ParameterBase):
         index_max_len = np.argmax(time_lengths)
         time = results[index_max_len][feature]["time"]
 
-        interpolated_results = []
-        for result in results:
+        interpolated_results = np.empty((len(results), len(time)))
+
+        indices = []
+        interpolations = []
+        for i, result in enumerate(results):
             interpolation = result[feature]["interpolation"]
 
             if interpolation is None:
-                interpolated_results.append(np.nan)
+                interpolated_results[i] = np.nan
                 logger.error("{}: Unknown error while creating the interpolation".format(feature))
 
             elif isinstance(interpolation, six.string_types):
-                interpolated_results.append(np.nan)
+                interpolated_results[i] = np.nan
                 logger.error(interpolation)
 
             else:
-                interpolated_results.append(interpolation(time))
+                indices.append(i)
+                interpolations.append(interpolation)
+
+        # Splines with the same knots and degree only differ in their
+        # coefficients, so they are grouped and evaluated as one spline
+        # with a coefficient array for each result
+        groups = collections.OrderedDict()
+        for i, interpolation in zip(indices, interpolations):
+            eval_args = getattr(interpolation, "_eval_args", None)
+
+            if isinstance(interpolation, scpi.UnivariateSpline) \
+                    and interpolation.ext == 0 and eval_args is not None:
+                knots, _, degree = eval_args
+                key = (degree, knots.tobytes())
+            else:
+                key = i
+
+            groups.setdefault(key, []).append((i, interpolation))
+
+        for group in groups.values():
+            if len(group) == 1:
+                i, interpolation = group[0]
+                interpolated_results[i] = interpolation(time)
+            else:
+                knots, _, degree = group[0][1]._eval_args
+                coefficients = np.array([interpolation._eval_args[1] for i, interpolation in group])
+
+                spline = scpi.BSpline(knots, coefficients.T, degree)
+                interpolated_results[[i for i, interpolation in group]] = spline(time).T
 
         return time, interpolated_results
 
@@ -270,13 +566,9 @@ class RunModel(ParameterBase):
         data.model_name = self.model.name
         data.model_ignore = self.model.ignore
 
-        def add_results(results, data, feature):
-            data[feature].time = []
-            data[feature].evaluations = []
-
-            for result in results:
-                data[feature].evaluations.append(result[feature]["values"])
-                data[feature].time.append(result[feature]["time"])
+        def add_results(feature_results, data, feature):
+            data[feature].time = [result["time"] for result in feature_results]
+            data[feature].evaluations = [result["values"] for result in feature_results]
 
         # results = self.regularize_nan_results(results)
 
@@ -298,48 +590,61 @@ class RunModel(ParameterBase):
                         #                  + " Try setting interpolate".format(feature))
 
 
+        interpolate = set(self.features.interpolate)
+
         # Store all results in data, interpolate as needed
         # TODO: save raw result instead of interpolated result?
         for feature in data:
+            # The results of this feature from each evaluation, so each result
+            # is only looked up once
+            feature_results = [result[feature] for result in results]
+
             # Interpolate the data if it is irregular, and ignore the model if required
-            if feature in self.features.interpolate or \
+            if feature in interpolate or \
                     (feature == self.model.name and self.model.interpolate and not self.model.ignore):
+                ndim = np.ndim(feature_results[0]["values"])
+
                 # TODO implement interpolation of >= 2d data, part2
-                if np.ndim(results[0][feature]["values"]) >= 2:
+                if ndim >= 2:
                     # raise NotImplementedError("Feature: {feature},".format(feature=feature)
                     #                           + " no support for >= 2D interpolation")
                     logger.error("{feature}:".format(feature=feature)
                                  + " no support for >= 2D interpolation implemented")
 
-                    add_results(results, data, feature)
+                    add_results(feature_results, data, feature)
 
 
-                elif np.ndim(results[0][feature]["values"]) == 1:
+                elif ndim == 1:
                     data[feature].time, data[feature].evaluations = self.apply_interpolation(results, feature)
 
                 # Interpolating a 0D result makes no sense, so if a 0D feature
                 # is supposed to be interpolated store it as normal
-                elif np.ndim(results[0][feature]["values"]) == 0:
+                elif ndim == 0:
                     logger.warning("{feature}: ".format(feature=feature) +
                                    "returns a 0D result. No interpolation is performed.")
 
-                    data[feature].time = results[0][feature]["time"]
+                    data[feature].time = feature_results[0]["time"]
 
-                    data[feature].evaluations = []
-                    for result in results:
-                        data[feature].evaluations.append(result[feature]["values"])
+                    evaluations = [result["values"] for result in feature_results]
+                    data[feature].evaluations = self.stack_evaluations(evaluations)
 
 
             elif feature == self.model.name and self.model.ignore:
-                add_results(results, data, feature)
+                add_results(feature_results, data, feature)
 
             else:
+                evaluations = [result["values"] for result in feature_results]
+                stacked_evaluations = self.stack_evaluations(evaluations)
+
                 # Check if features are irregular without being specified as a interpolate
                 # TODO if the feature is irregular, perform the complete interpolation here instead
-                if not self.is_regular(results, feature):
+                # Evaluations that could be stacked in one array are regular,
+                # so the full check is only needed when the stacking fails
+                if not isinstance(stacked_evaluations, np.ndarray) \
+                        and not self.is_regular(results, feature):
                     data.error.append(feature)
 
-                    add_results(results, data, feature)
+                    add_results(feature_results, data, feature)
 
                     if feature == self.model.name:
                         msg = "{}: The number of points varies between evaluations. ".format(feature) + \
@@ -358,17 +663,92 @@ class RunModel(ParameterBase):
 
                 else:
                     # Store data from results in a Data object
-                    data[feature].time = results[0][feature]["time"]
-
-                    data[feature].evaluations = []
-                    for result in results:
-                        data[feature].evaluations.append(result[feature]["values"])
+                    data[feature].time = feature_results[0]["time"]
+                    data[feature].evaluations = stacked_evaluations
 
         return data
 
 
 
 
+    def stack_evaluations(self, evaluations):
+        """
+        Store the evaluations of a regular model/feature in one preallocated
+        array.
+
+        Parameters
+        ----------
+        evaluations : list
+            The values of the model/feature for each evaluation. All
+            evaluations that do not contain numpy.nan must have the same shape.
+
+        Returns
+        -------
+        evaluations : {array, list}
+            An array with shape ``(len(evaluations),) + shape``, where ``shape``
+            is the shape of the evaluations that do not contain numpy.nan.
+            Evaluations that are numpy.nan are broadcast to ``shape``.
+            If the evaluations can not be stored in a single array, the
+            original list of evaluations is returned.
+
+        Notes
+        -----
+        An array is only returned if all evaluations that do not contain
+        numpy.nan have the same shape, so the model/feature is regular if an
+        array is returned.
+        """
+        shape = None
+        dtypes = []
+        has_nan = False
+
+        try:
+            for values in evaluations:
+                if contains_nan(values):
+                    has_nan = True
+                    continue
+
+                values = np.asarray(values)
+
+                if shape is None:
+                    shape = values.shape
+                elif values.shape != shape:
+                    return evaluations
+
+                dtypes.append(values.dtype)
+
+        # Irregular nested values
+        except ValueError:
+            return evaluations
+
+        # Only numpy.nan evaluations
+        if shape is None:
+            shape = np.shape(evaluations[0])
+
+        if has_nan:
+            dtypes.append(np.dtype(float))
+
+        # The dtype that can hold every evaluation, so no evaluation is
+        # truncated when it is stored
+        try:
+            dtype = np.result_type(*dtypes)
+        except TypeError:
+            return evaluations
+
+        if dtype == np.dtype("object"):
+            return evaluations
+
+        stacked_evaluations = np.empty((len(evaluations),) + shape, dtype=dtype)
+
+        try:
+            for i, values in enumerate(evaluations):
+                stacked_evaluations[i] = values
+        except (ValueError, TypeError):
+            return evaluations
+
+        return stacked_evaluations
+
+
+
     def evaluate_nodes(self, nodes, uncertain_parameters):
         """
         Evaluate the the model and calculate the features
@@ -412,14 +792,49 @@ class RunModel(ParameterBase):
         ------
         ImportError
             If xvfbwrapper is not installed.
+
+        Notes
+        -----
+        If the model graphics is suppressed, a virtual display is started the
+        first time the nodes are evaluated. The same virtual display is used
+        for all later evaluations, until `close` is called or the program
+        exits. The virtual display is only used while the nodes are evaluated,
+        the previous display is restored afterwards.
+
+        See also
+        --------
+        uncertainpy.core.RunModel.close
         """
+        display = None
         if self.model.suppress_graphics:
             if not prerequisites:
                 raise ImportError("Running with suppress_graphics require: xvfbwrapper")
 
-            vdisplay = Xvfb()
-            vdisplay.start()
+            # Starting an X server is slow, so the virtual display is started
+            # once and kept running until it is closed
+            if self._vdisplay is None:
+                vdisplay = Xvfb()
+
+                # Xvfb sets the display of the whole process
+                with _display():
+                    vdisplay.start()
+
+                atexit.register(vdisplay.stop)
+                self._vdisplay = vdisplay
+
+            display = ":{}".format(self._vdisplay.new_display)
+
+        with _display(display):
+            results = self._evaluate_model_parameters(nodes, uncertain_parameters)
 
+        return results
+
+
+    def _evaluate_model_parameters(self, nodes, uncertain_parameters):
+        """
+        Evaluate the model and calculate the features for the nodes, without
+        setting up the display. See `evaluate_nodes`.
+        """
         results = []
 
         model_parameters = self.create_model_parameters(nodes, uncertain_parameters)
@@ -427,16 +842,49 @@ class RunModel(ParameterBase):
         if self.CPUs:
             import multiprocess as mp
 
-            pool = mp.Pool(processes=self.CPUs)
-
-            # pool.map(self._parallel.run, model_parameters)
-            # chunksize = int(np.ceil(len(model_parameters)/self.CPUs))
-            chunksize = 1
-            for result in tqdm(pool.imap(self._parallel.run, model_parameters, chunksize),
-                               desc="Running model",
-                               total=len(nodes.T)):
-
-                results.append(result)
+            # Names of the shared memory of this evaluation start with a
+            # unique prefix
+            shared_memory_prefix = "uq" + uuid.uuid4().hex[:12]
+
+            pool = mp.Pool(processes=self.CPUs,
+                           initializer=_init_worker,
+                           initargs=(self._parallel,
+                                     _shared_memory_threshold,
+                                     shared_memory_prefix))
+
+            # Send the model parameters to the workers in chunks to reduce the
+            # communication overhead. The results arrive in an arbitrary order,
+            # so the index of each set of model parameters is used to place
+            # each result correctly
+            chunksize = max(1, len(model_parameters)//(self.CPUs*4))
+            results = [None]*len(model_parameters)
+            try:
+                for index, result in tqdm(pool.imap_unordered(_run_worker,
+                                                              enumerate(model_parameters),
+                                                              chunksize),
+                                          desc="Running model",
+                                          total=len(nodes.T)):
+
+                    if isinstance(result, BaseException):
+                        raise result
+
+                    results[index] = _load_arrays(result)
+
+            except BaseException:
+                pool.terminate()
+
+                # Only the main process frees the shared memory. The workers
+                # are stopped, so the shared memory of every result that is
+                # not loaded can be freed. Each result has at most a values
+                # and a time array for the model and each feature
+                nr_arrays = 2*(len(self.features.features_to_run) + 1)
+                for index, result in enumerate(results):
+                    if result is None:
+                        for number in range(nr_arrays):
+                            name = _shared_memory_name(shared_memory_prefix, index, number)
+                            _unlink_shared_memory(name)
+
+                raise
 
             pool.close()
 
@@ -448,11 +896,36 @@ class RunModel(ParameterBase):
                 results.append(result)
 
 
+        return results
 
-        if self.model.suppress_graphics:
-            vdisplay.stop()
 
-        return results
+
+    def close(self):
+        """
+        Stop the virtual display used to suppress the model graphics, if it
+        is running. A new virtual display is started if the nodes are
+        evaluated again with the model graphics suppressed.
+
+        Notes
+        -----
+        RunModel can also be used as a context manager, which calls `close`
+        when the with block exits.
+        """
+        if self._vdisplay is not None:
+            atexit.unregister(self._vdisplay.stop)
+
+            with _display():
+                self._vdisplay.stop()
+
+            self._vdisplay = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
 
 
 
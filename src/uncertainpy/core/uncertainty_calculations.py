@@ -217,22 +217,17 @@ class UncertaintyCalculations(ParameterBase):
         If a multivariate distribution is defined in the Parameters.distribution,
         that multivariate distribution is returned. Otherwise the joint
         multivariate distribution for the selected parameters is created from
-        the univariate distributions.
+        the univariate distributions. The joint multivariate distribution is
+        reused until the selected parameters or their distributions change.
 
         See also
         --------
         uncertainpy.Parameters
+        uncertainpy.Parameters.joint_distribution
         """
         uncertain_parameters = self.convert_uncertain_parameters(uncertain_parameters)
 
-        if self.parameters.distribution is None:
-            parameter_distributions = self.parameters.get("distribution", uncertain_parameters)
-
-            distribution = cp.J(*parameter_distributions)
-        else:
-            distribution = self.parameters.distribution
-
-        return distribution
+        return self.parameters.joint_distribution(uncertain_parameters)
 
 
     def dependent(self, distribution):
@@ -533,7 +528,8 @@ class UncertaintyCalculations(ParameterBase):
                                uncertain_parameters=None,
                                polynomial_order=4,
                                nr_collocation_nodes=None,
-                               allow_incomplete=True):
+                               allow_incomplete=True,
+                               sampling_rule="M"):
         """
         Create the polynomial approximation `U_hat` using pseudo-spectral
         projection.
@@ -555,6 +551,12 @@ class UncertaintyCalculations(ParameterBase):
             If the polynomial approximation should be performed for features or
             models with incomplete evaluations.
             Default is True.
+        sampling_rule : {"M", "S", "L", "H", "R"}, optional
+            The Chaospy sampling rule used to choose the collocation nodes, if
+            point collocation is used. "M" is Hammersley sampling, "S" is Sobol
+            sampling, "L" is Latin hypercube sampling, "H" is Halton sampling
+            and "R" is random sampling.
+            Default is "M".
 
         Returns
         -------
@@ -603,10 +605,10 @@ class UncertaintyCalculations(ParameterBase):
         In point collocation we require the polynomial approximation to be equal
         the model at a set of collocation nodes. This results in a set of linear
         equations for the polynomial coefficients we can solve. We choose
-        `nr_collocation_nodes` collocation nodes with Hammersley sampling from
-        the `distribution`. We evaluate the model and each feature in parallel,
-        and solve the resulting set of linear equations with Tikhonov
-        regularization.
+        `nr_collocation_nodes` collocation nodes from the `distribution`, by
+        default with Hammersley sampling (see `sampling_rule`). We evaluate the
+        model and each feature in parallel, and solve the resulting set of
+        linear equations with Tikhonov regularization.
 
         See also
         --------
@@ -622,7 +624,7 @@ class UncertaintyCalculations(ParameterBase):
         if nr_collocation_nodes is None:
             nr_collocation_nodes = 2*len(P) + 2
 
-        nodes = distribution.sample(nr_collocation_nodes, "M")
+        nodes = distribution.sample(nr_collocation_nodes, sampling_rule)
 
 
         # Running the model
@@ -828,7 +830,8 @@ class UncertaintyCalculations(ParameterBase):
                                           uncertain_parameters=None,
                                           polynomial_order=4,
                                           nr_collocation_nodes=None,
-                                          allow_incomplete=True):
+                                          allow_incomplete=True,
+                                          sampling_rule="M"):
         """
         Create the polynomial approximation `U_hat` using pseudo-spectral
         projection and the Rosenblatt transformation. Works for dependend
@@ -851,6 +854,12 @@ class UncertaintyCalculations(ParameterBase):
             If the polynomial approximation should be performed for features or
             models with incomplete evaluations.
             Default is True.
+        sampling_rule : {"M", "S", "L", "H", "R"}, optional
+            The Chaospy sampling rule used to choose the collocation nodes, if
+            point collocation is used. "M" is Hammersley sampling, "S" is Sobol
+            sampling, "L" is Latin hypercube sampling, "H" is Halton sampling
+            and "R" is random sampling.
+            Default is "M".
 
         Returns
         -------
@@ -900,11 +909,11 @@ class UncertaintyCalculations(ParameterBase):
         In point collocation we require the polynomial approximation to be equal
         the model at a set of collocation nodes. This results in a set of linear
         equations for the polynomial coefficients we can solve. We choose
-        `nr_collocation_nodes` collocation nodes with Hammersley sampling from
-        the independent distribution. We then transform the nodes using the
-        Rosenblatte transformation and evaluate the model and each
-        feature in parallel. We solve the resulting set of linear equations
-        with Tikhonov regularization.
+        `nr_collocation_nodes` collocation nodes from the independent
+        distribution, by default with Hammersley sampling (see `sampling_rule`).
+        We then transform the nodes using the Rosenblatte transformation and
+        evaluate the model and each feature in parallel. We solve the resulting
+        set of linear equations with Tikhonov regularization.
 
         See also
         --------
@@ -929,7 +938,7 @@ class UncertaintyCalculations(ParameterBase):
         if nr_collocation_nodes is None:
             nr_collocation_nodes = 2*len(P) + 2
 
-        nodes_R = dist_R.sample(nr_collocation_nodes, "M")
+        nodes_R = dist_R.sample(nr_collocation_nodes, sampling_rule)
         nodes = distribution.inv(dist_R.fwd(nodes_R))
 
         # Running the model
@@ -1194,6 +1203,7 @@ class UncertaintyCalculations(ParameterBase):
                          nr_pc_mc_samples=10**4,
                          allow_incomplete=True,
                          seed=None,
+                         sampling_rule="M",
                          **custom_kwargs):
         """
         Perform an uncertainty quantification and sensitivity analysis
@@ -1237,6 +1247,12 @@ class UncertaintyCalculations(ParameterBase):
             Default is True.
         seed : int, optional
             Set a random seed. If None, no seed is set. Default is None.
+        sampling_rule : {"M", "S", "L", "H", "R"}, optional
+            The Chaospy sampling rule used to choose the collocation nodes, if
+            point collocation is used. "M" is Hammersley sampling, "S" is Sobol
+            sampling, "L" is Latin hypercube sampling, "H" is Halton sampling
+            and "R" is random sampling.
+            Default is "M".
 
         Returns
         -------
@@ -1294,10 +1310,10 @@ class UncertaintyCalculations(ParameterBase):
         In point collocation we require the polynomial approximation to be equal
         the model at a set of collocation nodes. This results in a set of linear
         equations for the polynomial coefficients we can solve. We choose
-        `nr_collocation_nodes` collocation nodes with Hammersley sampling from
-        the `distribution`. We evaluate the model and each feature in parallel,
-        and solve the resulting set of linear equations with Tikhonov
-        regularization.
+        `nr_collocation_nodes` collocation nodes from the `distribution`, by
+        default with Hammersley sampling (see `sampling_rule`). We evaluate the
+        model and each feature in parallel, and solve the resulting set of
+        linear equations with Tikhonov regularization.
 
         Pseudo-spectral projection is based on least squares minimization and
         finds the expansion coefficients through numerical integration. The
@@ -1340,18 +1356,26 @@ class UncertaintyCalculations(ParameterBase):
                 raise ValueError('Dependent parameters require using the Rosenblatt transformation. Set rosenblatt="auto" or rosenblatt=True')
 
         if method == "collocation":
+            # Only pass on a non-default sampling rule, so subclasses that
+            # override the collocation methods without the argument keep working
+            sampling_kwargs = {}
+            if sampling_rule != "M":
+                sampling_kwargs["sampling_rule"] = sampling_rule
+
             if rosenblatt:
                 U_hat, distribution, data = \
                     self.create_PCE_collocation_rosenblatt(uncertain_parameters=uncertain_parameters,
                                                            polynomial_order=polynomial_order,
                                                            nr_collocation_nodes=nr_collocation_nodes,
-                                                           allow_incomplete=allow_incomplete)
+                                                           allow_incomplete=allow_incomplete,
+                                                           **sampling_kwargs)
             else:
                 U_hat, distribution, data = \
                     self.create_PCE_collocation(uncertain_parameters=uncertain_parameters,
                                                 polynomial_order=polynomial_order,
                                                 nr_collocation_nodes=nr_collocation_nodes,
-                                                allow_incomplete=allow_incomplete)
+                                                allow_incomplete=allow_incomplete,
+                                                **sampling_kwargs)
 
         elif method == "spectral":
             if rosenblatt:
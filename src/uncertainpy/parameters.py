@@ -2,8 +2,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import six
 import re
-import fileinput
-import sys
+import os
+import shutil
+import tempfile
 import collections
 
 import chaospy as cp
@@ -11,6 +12,91 @@ import chaospy as cp
 
 __all__ = ["Parameters", "Parameter"]
 
+
+# Compiled patterns used to find parameters in parameter files,
+# with the tuple of parameter names as key
+_parameter_patterns = {}
+
+
+def _parameter_pattern(names):
+    """
+    Get the compiled pattern that finds occurrences of ``name = number`` in a
+    parameter file, for any name in `names`. Each pattern is only compiled once.
+
+    Parameters
+    ----------
+    names: iterable
+        Names of the parameters.
+
+    Returns
+    -------
+    pattern: compiled regular expression
+        The bytes pattern with the parameter name in group 2 and the number
+        in group 4.
+    """
+    # The same names in any order share one compiled pattern. Longer
+    # names are tried first, but since the pattern requires ``=`` after
+    # the name, a name that starts with another name also matches
+    # through backtracking
+    names = tuple(sorted(names, key=len, reverse=True))
+
+    if names not in _parameter_patterns:
+        search_string = r"(\A|\b)(" + "|".join(re.escape(name) for name in names) \
+                        + r")(\s*=\s*)((([+-]?\d+[.]?\d*)|([+-]?\d*[.]?\d+))([eE][+-]?\d+)*)((?=\r?$)|\b)"
+        _parameter_patterns[names] = re.compile(search_string.encode("utf-8"), re.MULTILINE)
+
+    return _parameter_patterns[names]
+
+
+def _set_parameters_file(filename, values):
+    """
+    Set parameters to given values in a parameter file, with a single read
+    and a single write of the file.
+
+    Search `filename` for occurrences of ``name = number``
+    and replace ``number`` with ``values[name]``.
+
+    Parameters
+    ----------
+    filename: str
+        Name of file.
+    values: dict
+        New values to set in parameter file, with the parameter name as key.
+
+    Notes
+    -----
+    The new content is written to a uniquely named temporary file next to
+    `filename`, which then replaces `filename`. The file is therefore never
+    left partially written, and the temporary file is removed if the
+    rewrite fails.
+    """
+    if not values:
+        return
+
+    pattern = _parameter_pattern(values.keys())
+    new_values = {name.encode("utf-8"): str(value).encode("utf-8")
+                  for name, value in values.items()}
+
+    def replace(match):
+        return match.group(1) + match.group(2) + match.group(3) + new_values[match.group(2)]
+
+    with open(filename, "rb") as parameter_file:
+        content = pattern.sub(replace, parameter_file.read())
+
+    # A unique temporary file in the same directory, so it can replace
+    # filename and never overwrites another file
+    tmp_file, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename) or ".")
+    try:
+        with os.fdopen(tmp_file, "wb") as parameter_file:
+            parameter_file.write(content)
+
+        shutil.copymode(filename, tmp_filename)
+        os.replace(tmp_filename, filename)
+    finally:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+
+
 class Parameter(object):
     """
     Parameter object, contains name of parameter, value of parameter and distribution of parameter.
@@ -38,6 +124,9 @@ class Parameter(object):
         The distribution of the parameter. A parameter is considered uncertain
         if it has a distribution.
     """
+    # Slots instead of an instance dictionary, since a parameter only has
+    # these attributes and there can be many parameters
+    __slots__ = ("name", "value", "_distribution")
 
     def __init__(self, name, value=None, distribution=None):
         self.name = name
@@ -102,11 +191,7 @@ class Parameter(object):
         value: float, int
             New value to set in parameter file.
         """
-        search_string = r"(\A|\b)(" + self.name + r")(\s*=\s*)((([+-]?\d+[.]?\d*)|([+-]?\d*[.]?\d+))([eE][+-]?\d+)*)($|\b)"
-        pattern = re.compile(search_string)
-
-        for line in fileinput.input(filename, inplace=True):
-            sys.stdout.write(pattern.sub(r"\g<1>\g<2>\g<3>" + str(value), line))
+        _set_parameters_file(filename, {self.name: value})
 
 
     def reset_parameter_file(self, filename):
@@ -193,38 +278,37 @@ class Parameters(collections.MutableMapping):
         self.parameters = collections.OrderedDict()
         self.distribution = distribution
 
+        # The last joint distribution created from the parameter distributions,
+        # as (key, joint distribution)
+        self._joint_distribution = None
+
 
-        try:
-            # Handle dict
-            if isinstance(parameters, dict):
-                for parameter in parameters:
-                    if isinstance(parameters[parameter], Parameter):
-                        self.parameters[parameter] = parameters[parameter]
-                    else:
-                        if isinstance(parameters[parameter], cp.Distribution):
-                            self.parameters[parameter] = Parameter(parameter, distribution=parameters[parameter])
-                        else:
-                                self.parameters[parameter] = Parameter(parameter, value=parameters[parameter])
-
-            else:
-                # Handle lists
-                for parameter in parameters:
-                    if isinstance(parameter, Parameter):
-                        self.parameters[parameter.name] = parameter
-                    else:
-                        if len(parameter) == 2:
-                            if isinstance(parameter[1], cp.Distribution):
-                                self.parameters[parameter[0]] = Parameter(parameter[0], distribution=parameter[1])
-                            else:
-                                self.parameters[parameter[0]] = Parameter(parameter[0], value=parameter[1])
-                        else:
-                            self.parameters[parameter[0]] = Parameter(*parameter)
-        except TypeError as error:
-            msg = "Input to parameters is on the wrong format."
-            if not error.args:
-                error.args = ("",)
-            error.args = error.args + (msg,)
-            raise
+        msg = "Input to parameters is on the wrong format."
+
+        # Handle dict
+        if isinstance(parameters, dict):
+            for name, parameter in parameters.items():
+                if isinstance(parameter, Parameter):
+                    self.parameters[name] = parameter
+                elif isinstance(parameter, cp.Distribution):
+                    self.parameters[name] = Parameter(name, distribution=parameter)
+                else:
+                    self.parameters[name] = Parameter(name, value=parameter)
+
+        elif isinstance(parameters, six.string_types) or not hasattr(parameters, "__iter__"):
+            raise TypeError(msg)
+
+        # Handle lists
+        else:
+            for parameter in parameters:
+                if isinstance(parameter, Parameter):
+                    self.parameters[parameter.name] = parameter
+                elif not isinstance(parameter, (list, tuple)) or len(parameter) not in (2, 3):
+                    raise TypeError(msg)
+                elif len(parameter) == 2 and isinstance(parameter[1], cp.Distribution):
+                    self.parameters[parameter[0]] = Parameter(parameter[0], distribution=parameter[1])
+                else:
+                    self.parameters[parameter[0]] = Parameter(*parameter)
 
 
     def __getitem__(self, name):
@@ -360,12 +444,8 @@ class Parameters(collections.MutableMapping):
             List containing the `attribute` of each uncertain parameters.
         """
 
-        items = []
-        for parameter in self.parameters.values():
-            if parameter.distribution is not None:
-                items.append(getattr(parameter, attribute))
-
-        return items
+        return [getattr(parameter, attribute) for parameter in self.parameters.values()
+                if parameter.distribution is not None]
 
 
     def get(self, attribute="name", parameter_names=None):
@@ -392,16 +472,59 @@ class Parameters(collections.MutableMapping):
         """
 
         if parameter_names is None:
-            parameter_names = self.parameters.keys()
+            return [getattr(parameter, attribute) for parameter in self.parameters.values()]
 
         if isinstance(parameter_names, six.string_types):
             parameter_names = [parameter_names]
 
-        return_parameters = []
-        for parameter_name in parameter_names:
-            return_parameters.append(self.parameters[parameter_name])
+        return [getattr(self.parameters[name], attribute) for name in parameter_names]
+
+
+    def joint_distribution(self, parameter_names=None):
+        """
+        Return the joint multivariate distribution of the parameters.
+
+        The joint distribution is created from the univariate distributions
+        of the parameters, and is reused as long as the same parameters have
+        the same distributions.
 
-        return [getattr(parameter, attribute) for parameter in return_parameters]
+        Parameters
+        ----------
+        parameter_names: {None, list, str}, optional
+            A list of the parameters to create the joint distribution from,
+            or a string for a single parameter.
+            If None, all uncertain parameters are used.
+            Default is None.
+
+        Returns
+        -------
+        distribution: chaospy.Distribution
+            The joint multivariate distribution of the parameters.
+
+        Notes
+        -----
+        If a multivariate distribution is given in ``Parameters.distribution``,
+        that distribution is returned.
+        """
+        if self.distribution is not None:
+            return self.distribution
+
+        if parameter_names is None:
+            parameter_names = self.get_from_uncertain("name")
+
+        if isinstance(parameter_names, six.string_types):
+            parameter_names = [parameter_names]
+
+        distributions = self.get("distribution", parameter_names)
+
+        # The cached joint distribution keeps a reference to each distribution,
+        # so their ids can not be reused while the joint distribution is cached
+        key = tuple(zip(parameter_names, [id(distribution) for distribution in distributions]))
+
+        if self._joint_distribution is None or self._joint_distribution[0] != key:
+            self._joint_distribution = (key, cp.J(*distributions))
+
+        return self._joint_distribution[1]
 
 
     def set_parameters_file(self, filename, parameters):
@@ -415,11 +538,15 @@ class Parameters(collections.MutableMapping):
         ----------
         filename: str
             Name of file.
-        parameters: list
-            List of parameter names.
+        parameters: dict
+            Dictionary with the parameter names as keys and the new values as
+            values.
         """
+        values = {}
         for parameter in parameters:
-            self.parameters[parameter].set_parameter_file(filename, parameters[parameter])
+            values[self.parameters[parameter].name] = parameters[parameter]
+
+        _set_parameters_file(filename, values)
 
 
     def reset_parameter_file(self, filename):
@@ -434,5 +561,8 @@ class Parameters(collections.MutableMapping):
         filename: str
             Name of file.
         """
-        for parameter in self.parameters:
-            self.parameters[parameter].set_parameter_file(filename, self.parameters[parameter].value)
+        values = {}
+        for parameter in self.parameters.values():
+            values[parameter.name] = parameter.value
+
+        _set_parameters_file(filename, values)
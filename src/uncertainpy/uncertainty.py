@@ -228,6 +228,7 @@ class UncertaintyQuantification(ParameterBase):
                  save=True,
                  data_folder="data",
                  filename=None,
+                 sampling_rule="M",
                  **custom_kwargs):
         """
         Perform an uncertainty quantification and sensitivity analysis
@@ -315,6 +316,12 @@ class UncertaintyQuantification(ParameterBase):
         filename : {None, str}, optional
             Name of the data file. If None the model name is used.
             Default is None.
+        sampling_rule : {"M", "S", "L", "H", "R"}, optional
+            The Chaospy sampling rule used to choose the collocation nodes, if
+            polynomial chaos with point collocation is used. "M" is Hammersley
+            sampling, "S" is Sobol sampling, "L" is Latin hypercube sampling,
+            "H" is Halton sampling and "R" is random sampling.
+            Default is "M".
         **custom_kwargs
             Any number of arguments for either the custom polynomial chaos method,
             ``create_PCE_custom``, or the custom uncertainty quantification,
@@ -399,6 +406,7 @@ class UncertaintyQuantification(ParameterBase):
                                                     rosenblatt=rosenblatt,
                                                     polynomial_order=polynomial_order,
                                                     nr_collocation_nodes=nr_collocation_nodes,
+                                                    sampling_rule=sampling_rule,
                                                     quadrature_order=quadrature_order,
                                                     nr_pc_mc_samples=nr_pc_mc_samples,
                                                     allow_incomplete=allow_incomplete,
@@ -417,6 +425,7 @@ class UncertaintyQuantification(ParameterBase):
                                              rosenblatt=rosenblatt,
                                              polynomial_order=polynomial_order,
                                              nr_collocation_nodes=nr_collocation_nodes,
+                                             sampling_rule=sampling_rule,
                                              quadrature_order=quadrature_order,
                                              nr_pc_mc_samples=nr_pc_mc_samples,
                                              allow_incomplete=allow_incomplete,
@@ -567,6 +576,7 @@ class UncertaintyQuantification(ParameterBase):
                          save=True,
                          data_folder="data",
                          filename=None,
+                         sampling_rule="M",
                          **custom_kwargs):
         """
         Perform an uncertainty quantification and sensitivity analysis
@@ -638,6 +648,12 @@ class UncertaintyQuantification(ParameterBase):
         filename : {None, str}, optional
             Name of the data file. If None the model name is used.
             Default is None.
+        sampling_rule : {"M", "S", "L", "H", "R"}, optional
+            The Chaospy sampling rule used to choose the collocation nodes, if
+            polynomial chaos with point collocation is used. "M" is Hammersley
+            sampling, "S" is Sobol sampling, "L" is Latin hypercube sampling,
+            "H" is Halton sampling and "R" is random sampling.
+            Default is "M".
         **custom_kwargs
             Any number of arguments for the custom polynomial chaos method,
             ``create_PCE_custom``.
@@ -699,6 +715,11 @@ class UncertaintyQuantification(ParameterBase):
                                  + "The Monte-Carlo method might be faster.")
 
 
+        # Only pass on a non-default sampling rule, so custom uncertainty
+        # calculations written without the argument keep working
+        if sampling_rule != "M":
+            custom_kwargs["sampling_rule"] = sampling_rule
+
         self.data = self.uncertainty_calculations.polynomial_chaos(
             method=method,
             rosenblatt=rosenblatt,
@@ -864,7 +885,8 @@ class UncertaintyQuantification(ParameterBase):
                                 figureformat=".png",
                                 save=True,
                                 data_folder="data",
-                                filename=None):
+                                filename=None,
+                                sampling_rule="M"):
         """
         Perform an uncertainty quantification and sensitivity analysis for a
         single parameter at the time using polynomial chaos expansions.
@@ -935,6 +957,12 @@ class UncertaintyQuantification(ParameterBase):
         filename : {None, str}, optional
             Name of the data file. If None the model name is used.
             Default is None.
+        sampling_rule : {"M", "S", "L", "H", "R"}, optional
+            The Chaospy sampling rule used to choose the collocation nodes, if
+            polynomial chaos with point collocation is used. "M" is Hammersley
+            sampling, "S" is Sobol sampling, "L" is Latin hypercube sampling,
+            "H" is Halton sampling and "R" is random sampling.
+            Default is "M".
         **custom_kwargs
             Any number of arguments for the custom polynomial chaos method,
             ``create_PCE_custom``.
@@ -1003,6 +1031,12 @@ class UncertaintyQuantification(ParameterBase):
         if seed is not None:
             np.random.seed(seed)
 
+        # Only pass on a non-default sampling rule, so custom uncertainty
+        # calculations written without the argument keep working
+        sampling_kwargs = {}
+        if sampling_rule != "M":
+            sampling_kwargs["sampling_rule"] = sampling_rule
+
         data_dict = {}
 
         for uncertain_parameter in uncertain_parameters:
@@ -1017,6 +1051,7 @@ class UncertaintyQuantification(ParameterBase):
                 quadrature_order=quadrature_order,
                 nr_pc_mc_samples=nr_pc_mc_samples,
                 allow_incomplete=allow_incomplete,
+                **sampling_kwargs
             )
 
             data.backend = self.backend
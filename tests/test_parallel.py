@@ -404,6 +404,35 @@ class TestParallel(unittest.TestCase):
                               scipy.interpolate.fitpack2.UnivariateSpline)
 
 
+    def test_to_array(self):
+        result = self.parallel.to_array([[1, 2], [3, 4]])
+
+        self.assertIsInstance(result, np.ndarray)
+        self.assertTrue(np.array_equal(result, [[1, 2], [3, 4]]))
+
+
+    def test_to_array_irregular(self):
+        values = [[1, 2], [3]]
+        result = self.parallel.to_array(values)
+
+        self.assertIs(result, values)
+
+
+    def test_to_array_number(self):
+        result = self.parallel.to_array(1)
+
+        self.assertEqual(result, 1)
+
+
+    def test_run_indexed(self):
+        index, results = self.parallel.run_indexed((3, self.model_parameters))
+
+        self.assertEqual(index, 3)
+        self.assertTrue(np.array_equal(results["TestingModel1d"]["time"], np.arange(0, 10)))
+        self.assertTrue(np.array_equal(results["TestingModel1d"]["values"], np.arange(0, 10) + 1))
+        self.assertEqual(results["feature0d"]["values"], 1)
+
+
     def test_run_kwargs(self):
         def test_model(a=10, b=11, c=12):
             return a + b, c
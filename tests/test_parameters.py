@@ -2,10 +2,12 @@ import unittest
 import os
 import shutil
 import subprocess
+import pickle
 
 import chaospy as cp
 
 from uncertainpy import Parameter, Parameters
+from uncertainpy.parameters import _parameter_pattern
 
 
 class TestParameter(unittest.TestCase):
@@ -94,6 +96,19 @@ class TestParameter(unittest.TestCase):
         self.assertIsInstance(self.parameter.distribution, cp.Distribution)
 
 
+    def test_slots(self):
+        parameter = Parameter("gbar_Na", 120, cp.Uniform(110, 130))
+
+        with self.assertRaises(AttributeError):
+            parameter.unknown = 1
+
+        parameter = pickle.loads(pickle.dumps(parameter))
+
+        self.assertEqual(parameter.name, "gbar_Na")
+        self.assertEqual(parameter.value, 120)
+        self.assertIsInstance(parameter.distribution, cp.Distribution)
+
+
     def test_set_parameters_file(self):
         parameter_file = os.path.join(self.output_test_dir, self.parameter_filename)
 
@@ -368,6 +383,21 @@ class TestParameters(unittest.TestCase):
         with self.assertRaises(TypeError):
             Parameters(parameter_list)
 
+
+    def test_init_string(self):
+        with self.assertRaises(TypeError):
+            Parameters("gbar_Na")
+
+
+    def test_init_list_wrong_element(self):
+        parameter_list = [["gbar_Na", 120, None], 1]
+
+        with self.assertRaises(TypeError) as error:
+            Parameters(parameter_list)
+
+        self.assertEqual(str(error.exception), "Input to parameters is on the wrong format.")
+
+
     def test_getitem(self):
         parameter_list = [["gbar_Na", 120, None],
                          ["gbar_K", 36, None],
@@ -556,6 +586,57 @@ class TestParameters(unittest.TestCase):
         self.assertIsInstance(result[2], cp.Distribution)
 
 
+    def test_joint_distribution(self):
+        parameter_list = [["gbar_Na", 120, cp.Uniform(110, 130)],
+                         ["gbar_K", 36, cp.Normal(36, 1)],
+                         ["gbar_L", 0.3, None]]
+
+        self.parameters = Parameters(parameter_list)
+        distribution = self.parameters.joint_distribution()
+
+        self.assertIsInstance(distribution, cp.Distribution)
+        self.assertEqual(len(distribution), 2)
+        self.assertIs(self.parameters.joint_distribution(), distribution)
+
+
+    def test_joint_distribution_one(self):
+        parameter_list = [["gbar_Na", 120, cp.Uniform(110, 130)],
+                         ["gbar_K", 36, cp.Normal(36, 1)]]
+
+        self.parameters = Parameters(parameter_list)
+        distribution = self.parameters.joint_distribution("gbar_K")
+
+        self.assertIsInstance(distribution, cp.Distribution)
+        self.assertEqual(len(distribution), 1)
+
+
+    def test_joint_distribution_changed(self):
+        parameter_list = [["gbar_Na", 120, cp.Uniform(110, 130)],
+                         ["gbar_K", 36, cp.Normal(36, 1)]]
+
+        self.parameters = Parameters(parameter_list)
+        distribution = self.parameters.joint_distribution()
+
+        self.parameters.set_distribution("gbar_K", cp.Uniform(30, 40))
+        self.assertIsNot(self.parameters.joint_distribution(), distribution)
+
+        distribution = self.parameters.joint_distribution()
+
+        self.parameters["gbar_Na"].distribution = cp.Uniform(100, 140)
+        self.assertIsNot(self.parameters.joint_distribution(), distribution)
+
+
+    def test_joint_distribution_multivariate(self):
+        parameter_list = [["gbar_Na", 120, None],
+                         ["gbar_K", 36, None]]
+
+        multivariate = cp.J(cp.Uniform(110, 130), cp.Normal(36, 1))
+
+        self.parameters = Parameters(parameter_list, distribution=multivariate)
+
+        self.assertIs(self.parameters.joint_distribution(), multivariate)
+
+
 
     def test_set_parameters_file(self):
         parameter_file = os.path.join(self.output_test_dir, self.parameter_filename)
@@ -599,6 +680,121 @@ class TestParameters(unittest.TestCase):
         self.assertEqual(result, 0)
 
 
+    def test_set_parameters_file_line_endings(self):
+        parameter_file = os.path.join(self.output_test_dir, "line_endings.hoc")
+
+        with open(parameter_file, "wb") as f:
+            f.write(b"a = 1.\r\nab = 2e3\r\nb = 3\n")
+        os.chmod(parameter_file, 0o740)
+
+        parameter_list = [["a", 1, None],
+                          ["ab", 2e3, None]]
+
+        self.parameters = Parameters(parameter_list)
+
+        self.parameters.set_parameters_file(parameter_file, {"a": 10, "ab": 20})
+
+        with open(parameter_file, "rb") as f:
+            self.assertEqual(f.read(), b"a = 10\r\nab = 20\r\nb = 3\n")
+
+        self.assertEqual(os.stat(parameter_file).st_mode & 0o777, 0o740)
+        self.assertEqual(os.listdir(self.output_test_dir), ["line_endings.hoc"])
+
+
+    def test_set_parameters_file_prefix_names(self):
+        parameter_file = os.path.join(self.output_test_dir, "prefix.hoc")
+
+        parameter_list = [["a", 1, None],
+                          ["ab", 2, None]]
+
+        self.parameters = Parameters(parameter_list)
+
+        for parameter_change in [{"a": 10, "ab": 20}, {"ab": 20, "a": 10}]:
+            with open(parameter_file, "w") as f:
+                f.write("ab = 2\na = 1\nabc = 3\nab=2 a=1\n")
+
+            self.parameters.set_parameters_file(parameter_file, parameter_change)
+
+            with open(parameter_file, "r") as f:
+                self.assertEqual(f.read(), "ab = 20\na = 10\nabc = 3\nab=20 a=10\n")
+
+        with open(parameter_file, "w") as f:
+            f.write("ab = 2\na = 1\n")
+
+        self.parameters.set_parameters_file(parameter_file, {"a": 10})
+
+        with open(parameter_file, "r") as f:
+            self.assertEqual(f.read(), "ab = 2\na = 10\n")
+
+        self.assertIs(_parameter_pattern(["a", "ab"]), _parameter_pattern(["ab", "a"]))
+
+
+    def test_set_parameters_file_metacharacters(self):
+        parameter_file = os.path.join(self.output_test_dir, "metacharacters.hoc")
+
+        with open(parameter_file, "w") as f:
+            f.write("g.bar = 1\ngXbar = 2\na+b = 3\naab = 4\nx[1] = 5\nx1 = 6\n")
+
+        parameter_list = [["g.bar", 1, None],
+                          ["a+b", 3, None],
+                          ["x[1]", 5, None]]
+
+        self.parameters = Parameters(parameter_list)
+
+        self.parameters.set_parameters_file(parameter_file, {"g.bar": 10, "a+b": 30, "x[1]": 50})
+
+        with open(parameter_file, "r") as f:
+            self.assertEqual(f.read(), "g.bar = 10\ngXbar = 2\na+b = 30\naab = 4\nx[1] = 50\nx1 = 6\n")
+
+
+    def test_set_parameters_file_existing_tmp(self):
+        parameter_file = os.path.join(self.output_test_dir, "existing.hoc")
+
+        with open(parameter_file, "w") as f:
+            f.write("a = 1\n")
+
+        with open(parameter_file + ".tmp", "w") as f:
+            f.write("user file\n")
+
+        self.parameters = Parameters([["a", 1, None]])
+
+        self.parameters.set_parameters_file(parameter_file, {"a": 10})
+
+        with open(parameter_file) as f:
+            self.assertEqual(f.read(), "a = 10\n")
+
+        with open(parameter_file + ".tmp") as f:
+            self.assertEqual(f.read(), "user file\n")
+
+        self.assertEqual(sorted(os.listdir(self.output_test_dir)),
+                         ["existing.hoc", "existing.hoc.tmp"])
+
+
+    def test_set_parameters_file_error(self):
+        parameter_file = os.path.join(self.output_test_dir, "error.hoc")
+
+        with open(parameter_file, "w") as f:
+            f.write("a = 1\n")
+
+        self.parameters = Parameters([["a", 1, None]])
+
+        def replace(source, destination):
+            raise OSError("Unable to replace file")
+
+        os_replace = os.replace
+        os.replace = replace
+        try:
+            with self.assertRaises(OSError):
+                self.parameters.set_parameters_file(parameter_file, {"a": 10})
+        finally:
+            os.replace = os_replace
+
+        with open(parameter_file) as f:
+            self.assertEqual(f.read(), "a = 1\n")
+
+        self.assertEqual(os.listdir(self.output_test_dir), ["error.hoc"])
+
+
     def test_str(self):
         parameter_list = [["gbar_Na", 120, None],
                           ["gbar_K", 36, None],
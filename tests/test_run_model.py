@@ -1,6 +1,7 @@
 import unittest
 import os
 import shutil
+import time
 import scipy.interpolate
 
 import numpy as np
@@ -8,6 +9,7 @@ import multiprocess as mp
 
 from uncertainpy import Parameters
 from uncertainpy.core import RunModel
+from uncertainpy.core import run_model
 from uncertainpy.models import Model
 from uncertainpy.features import Features, SpikingFeatures
 
@@ -16,6 +18,26 @@ from .testing_classes import TestingModel0d, TestingModel1d, TestingModel2d
 from .testing_classes import TestingModelAdaptive
 
 
+class FakeXvfb(object):
+    """
+    Records how the virtual display is used, and sets the display like Xvfb,
+    without starting an X server.
+    """
+    def __init__(self):
+        self.new_display = None
+        self.started = 0
+        self.stopped = 0
+
+    def start(self):
+        self.started += 1
+        self.new_display = 1234
+        os.environ["DISPLAY"] = ":1234"
+
+    def stop(self):
+        self.stopped += 1
+        os.environ.pop("DISPLAY", None)
+
+
 
 
 class TestRunModel(unittest.TestCase):
@@ -44,6 +66,8 @@ class TestRunModel(unittest.TestCase):
 
 
     def tearDown(self):
+        self.runmodel.close()
+
         if os.path.isdir(self.output_test_dir):
             shutil.rmtree(self.output_test_dir)
 
@@ -337,6 +361,162 @@ class TestRunModel(unittest.TestCase):
 
 
 
+    def test_evaluate_nodes_parallel_order(self):
+        nodes = np.array([[0, 1, 2, 3, 4, 5, 6, 7], [1, 2, 3, 4, 5, 6, 7, 8]])
+        self.runmodel.CPUs = 3
+
+        results = self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+
+        self.assertEqual(len(results), 8)
+        for i, result in enumerate(results):
+            self.assertTrue(np.array_equal(result["TestingModel1d"]["values"],
+                                           np.arange(0, 10) + 2*i + 1))
+
+
+    def test_evaluate_nodes_list(self):
+        nodes = np.array([[0, 1, 2], [1, 2, 3]])
+
+        for CPUs in [None, 3]:
+            self.runmodel.CPUs = CPUs
+
+            results = self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+
+            self.assertIsInstance(results, list)
+            self.assertEqual(len(results), 3)
+            self.assertIsInstance(results[0], dict)
+
+
+    def test_evaluate_nodes_parallel_shared_memory(self):
+        nodes = np.array([[0, 1, 2], [1, 2, 3]])
+        self.runmodel.CPUs = 3
+
+        # The results as they arrive from the workers, before the arrays are
+        # loaded from shared memory
+        received = []
+
+        def load_arrays(result):
+            received.append(result["TestingModel1d"]["values"])
+            return load_arrays_original(result)
+
+        load_arrays_original = run_model._load_arrays
+        threshold = run_model._shared_memory_threshold
+
+        run_model._load_arrays = load_arrays
+        run_model._shared_memory_threshold = 1
+        try:
+            results = self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+        finally:
+            run_model._load_arrays = load_arrays_original
+            run_model._shared_memory_threshold = threshold
+
+        self.assertEqual(len(received), 3)
+        for values in received:
+            self.assertIsInstance(values, run_model._SharedArray)
+
+        for i, result in enumerate(results):
+            self.assertIsInstance(result["TestingModel1d"]["values"], np.ndarray)
+            self.assertTrue(np.array_equal(result["TestingModel1d"]["values"],
+                                           np.arange(0, 10) + 2*i + 1))
+            self.assertTrue(np.array_equal(result["TestingModel1d"]["time"],
+                                           np.arange(0, 10)))
+
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "requires /dev/shm")
+    def test_evaluate_nodes_parallel_shared_memory_error(self):
+        def model(a, b):
+            if a == 13:
+                raise ValueError("Model error")
+
+            return np.arange(0, 10), np.arange(0, 10) + a + b
+
+        self.runmodel = RunModel(model=model,
+                                 parameters=self.parameters,
+                                 logger_level="error",
+                                 CPUs=2)
+
+        # 40 nodes with 2 CPUs are sent to the workers in chunks of 5, so the
+        # failing evaluation shares a chunk with evaluations that succeed
+        nodes = np.array([np.arange(0, 40), np.arange(0, 40) + 1])
+
+        threshold = run_model._shared_memory_threshold
+        run_model._shared_memory_threshold = 1
+
+        shared_memory = set(os.listdir("/dev/shm"))
+        try:
+            with self.assertRaises(ValueError) as error:
+                self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+        finally:
+            run_model._shared_memory_threshold = threshold
+
+        self.assertEqual(str(error.exception), "Model error")
+        self.assertEqual(set(os.listdir("/dev/shm")) - shared_memory, set())
+
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "requires /dev/shm")
+    def test_evaluate_nodes_parallel_error_no_wait(self):
+        def model(a, b):
+            if a == 0:
+                raise ValueError("Model error")
+
+            time.sleep(1)
+
+            return np.arange(0, 10), np.arange(0, 10) + a + b
+
+        self.runmodel = RunModel(model=model,
+                                 parameters=self.parameters,
+                                 logger_level="error",
+                                 CPUs=3)
+
+        nodes = np.array([np.arange(0, 12), np.arange(0, 12) + 1])
+
+        threshold = run_model._shared_memory_threshold
+        run_model._shared_memory_threshold = 1
+
+        shared_memory = set(os.listdir("/dev/shm"))
+        start_time = time.time()
+        try:
+            with self.assertRaises(ValueError):
+                self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+        finally:
+            run_model._shared_memory_threshold = threshold
+
+        # The remaining evaluations take about 4 seconds
+        self.assertLess(time.time() - start_time, 2)
+        self.assertEqual(set(os.listdir("/dev/shm")) - shared_memory, set())
+
+
+    def test_share_arrays(self):
+        result = {"model": {"values": np.arange(10.), "time": np.arange(10.)},
+                  "feature": {"values": np.array(1), "time": np.nan},
+                  "feature_object": {"values": np.array([[1, 2], [1]], dtype=object)}}
+
+        threshold = run_model._shared_memory_threshold
+        prefix = run_model._shared_memory_prefix
+
+        run_model._shared_memory_threshold = 16
+        run_model._shared_memory_prefix = "uqtest"
+        try:
+            shared = run_model._share_arrays(result, 0)
+        finally:
+            run_model._shared_memory_threshold = threshold
+            run_model._shared_memory_prefix = prefix
+
+        self.assertEqual(shared["model"]["values"].name, "uqtest_0_0")
+        self.assertEqual(shared["model"]["time"].name, "uqtest_0_1")
+
+        self.assertIsInstance(shared["model"]["values"], run_model._SharedArray)
+        self.assertIsInstance(shared["model"]["time"], run_model._SharedArray)
+        self.assertIsInstance(shared["feature"]["values"], np.ndarray)
+        self.assertIsInstance(shared["feature_object"]["values"], np.ndarray)
+
+        loaded = run_model._load_arrays(shared)
+
+        self.assertTrue(np.array_equal(loaded["model"]["values"], np.arange(10.)))
+        self.assertTrue(np.array_equal(loaded["model"]["time"], np.arange(10.)))
+        self.assertEqual(loaded["feature"]["values"], 1)
+        self.assertTrue(np.isnan(loaded["feature"]["time"]))
+
+
     def test_evaluate_nodes_no_multiproccess_model_1d(self):
         nodes = np.array([[0, 1, 2], [1, 2, 3]])
         self.runmodel.CPUs = None
@@ -426,6 +606,77 @@ class TestRunModel(unittest.TestCase):
         self.runmodel.evaluate_nodes(nodes, ["a", "b"])
 
 
+    @unittest.skipUnless(shutil.which("Xvfb"), "requires Xvfb")
+    def test_evaluate_nodes_supress_graphics_reuse_display(self):
+        nodes = np.array([[0, 1, 2], [1, 2, 3]])
+        self.runmodel.model.suppress_graphics = True
+
+        self.assertIsNone(self.runmodel._vdisplay)
+
+        display = os.environ.get("DISPLAY")
+
+        self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+        vdisplay = self.runmodel._vdisplay
+
+        self.assertEqual(os.environ.get("DISPLAY"), display)
+
+        self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+        self.assertIs(self.runmodel._vdisplay, vdisplay)
+
+        self.runmodel.close()
+        self.assertIsNone(self.runmodel._vdisplay)
+        self.assertEqual(os.environ.get("DISPLAY"), display)
+
+
+    def test_evaluate_nodes_supress_graphics_display(self):
+        nodes = np.array([[0, 1, 2], [1, 2, 3]])
+        self.runmodel.model.suppress_graphics = True
+        self.runmodel.CPUs = None
+
+        displays = []
+
+        def run(model_parameters):
+            displays.append(os.environ.get("DISPLAY"))
+            return run_parallel(model_parameters)
+
+        run_parallel = self.runmodel._parallel.run
+        self.runmodel._parallel.run = run
+
+        prerequisites = run_model.prerequisites
+        Xvfb = getattr(run_model, "Xvfb", None)
+        display = os.environ.get("DISPLAY")
+
+        run_model.prerequisites = True
+        run_model.Xvfb = FakeXvfb
+        try:
+            self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+            vdisplay = self.runmodel._vdisplay
+
+            self.assertEqual(displays, [":1234"]*3)
+            self.assertEqual(os.environ.get("DISPLAY"), display)
+
+            self.runmodel.model.suppress_graphics = False
+            self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+
+            self.assertEqual(displays[3:], [display]*3)
+
+            with self.runmodel:
+                self.runmodel.model.suppress_graphics = True
+                self.runmodel.evaluate_nodes(nodes, ["a", "b"])
+
+            self.assertEqual(vdisplay.started, 1)
+            self.assertEqual(vdisplay.stopped, 1)
+            self.assertIsNone(self.runmodel._vdisplay)
+            self.assertEqual(os.environ.get("DISPLAY"), display)
+        finally:
+            run_model.prerequisites = prerequisites
+            run_model.Xvfb = Xvfb
+            if display is None:
+                os.environ.pop("DISPLAY", None)
+            else:
+                os.environ["DISPLAY"] = display
+
+
 
     def test_results_to_data_model_1d_all_features(self):
         nodes = np.array([[0, 1, 2], [1, 2, 3]])
@@ -958,6 +1209,85 @@ class TestRunModel(unittest.TestCase):
         self.assertFalse(self.runmodel.is_regular(results, "test"))
 
 
+    def test_stack_evaluations(self):
+        evaluations = [np.arange(0, 10), np.arange(0, 10) + 1, np.arange(0, 10) + 2]
+
+        result = self.runmodel.stack_evaluations(evaluations)
+
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.shape, (3, 10))
+        self.assertTrue(np.array_equal(result, evaluations))
+
+
+    def test_stack_evaluations_nan(self):
+        evaluations = [np.arange(0, 10), np.nan, np.arange(0, 10) + 2]
+
+        result = self.runmodel.stack_evaluations(evaluations)
+
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.shape, (3, 10))
+        self.assertTrue(np.array_equal(result[0], np.arange(0, 10)))
+        self.assertTrue(np.all(np.isnan(result[1])))
+        self.assertTrue(np.array_equal(result[2], np.arange(0, 10) + 2))
+
+
+    def test_stack_evaluations_irregular(self):
+        evaluations = [np.arange(0, 10), np.full(5, np.nan)]
+
+        result = self.runmodel.stack_evaluations(evaluations)
+
+        self.assertIs(result, evaluations)
+
+
+    def test_stack_evaluations_different_shapes(self):
+        evaluations = [np.arange(0, 10), np.arange(0, 5)]
+
+        result = self.runmodel.stack_evaluations(evaluations)
+
+        self.assertIs(result, evaluations)
+
+
+    def test_stack_evaluations_number_and_array(self):
+        evaluations = [np.arange(0, 10), 1]
+
+        result = self.runmodel.stack_evaluations(evaluations)
+
+        self.assertIs(result, evaluations)
+
+
+    def test_stack_evaluations_int_and_float(self):
+        evaluations = [0, 1.7, 2.9]
+
+        result = self.runmodel.stack_evaluations(evaluations)
+
+        self.assertEqual(result.dtype, np.dtype(float))
+        self.assertTrue(np.array_equal(result, [0, 1.7, 2.9]))
+
+        evaluations = [np.array([1, 2]), np.array([1.5, 2.5])]
+
+        result = self.runmodel.stack_evaluations(evaluations)
+
+        self.assertEqual(result.dtype, np.dtype(float))
+        self.assertTrue(np.array_equal(result, [[1, 2], [1.5, 2.5]]))
+
+
+    def test_stack_evaluations_bool_and_float(self):
+        evaluations = [True, 0.5]
+
+        result = self.runmodel.stack_evaluations(evaluations)
+
+        self.assertEqual(result.dtype, np.dtype(float))
+        self.assertTrue(np.array_equal(result, [1, 0.5]))
+
+
+    def test_stack_evaluations_nested_irregular(self):
+        evaluations = [[[], [1, 2]], [[1], [1, 2]]]
+
+        result = self.runmodel.stack_evaluations(evaluations)
+
+        self.assertIs(result, evaluations)
+
+
     def test_apply_interpolation(self):
         nodes = np.array([[0, 1, 2], [1, 2, 3]])
         self.runmodel.model.interpolate = True
@@ -977,6 +1307,7 @@ class TestRunModel(unittest.TestCase):
         time, interpolated_solves = self.runmodel.apply_interpolation(results, "TestingModel1d")
 
         self.assertTrue(np.array_equal(time, np.arange(0, 10)))
+        self.assertEqual(interpolated_solves.shape, (3, 10))
         self.assertTrue(np.allclose(interpolated_solves[0],
                                     np.arange(0, 10) + 1))
         self.assertTrue(np.allclose(interpolated_solves[1],
@@ -997,6 +1328,29 @@ class TestRunModel(unittest.TestCase):
                                     np.arange(0, 20) + 5.))
 
 
+    def test_apply_interpolation_grouped(self):
+        time = np.linspace(0, 10, 21)
+        time_other = np.linspace(-1, 11, 15)
+
+        interpolations = [scipy.interpolate.InterpolatedUnivariateSpline(time, np.sin(time), k=3),
+                          scipy.interpolate.InterpolatedUnivariateSpline(time_other, np.cos(time_other), k=3),
+                          scipy.interpolate.InterpolatedUnivariateSpline(time, time**2, k=3),
+                          scipy.interpolate.interp1d(time, time + 1)]
+
+        results = []
+        for interpolation in interpolations:
+            results.append({"TestingModel1d": {"values": None,
+                                               "time": time,
+                                               "interpolation": interpolation}})
+
+        time_result, interpolated_solves = self.runmodel.apply_interpolation(results, "TestingModel1d")
+
+        self.assertTrue(np.array_equal(time_result, time))
+        self.assertEqual(interpolated_solves.shape, (4, 21))
+        for interpolation, interpolated in zip(interpolations, interpolated_solves):
+            self.assertTrue(np.allclose(interpolated, interpolation(time)))
+
+
     def test_apply_interpolation_none(self):
         nodes = np.array([[0, 1, 2], [1, 2, 3]])
         self.runmodel.model.interpolate = True
@@ -1013,7 +1367,7 @@ class TestRunModel(unittest.TestCase):
         self.assertTrue(np.array_equal(time, np.arange(0, 10)))
         self.assertTrue(np.allclose(interpolated_solves[0],
                                     np.arange(0, 10) + 1))
-        self.assertTrue(np.isnan(interpolated_solves[1]))
+        self.assertTrue(np.all(np.isnan(interpolated_solves[1])))
         self.assertTrue(np.allclose(interpolated_solves[2],
                                     np.arange(0, 10) + 5.))
 
@@ -825,6 +825,7 @@ class TestUncertainty(TestCasePlot):
                                          rosenblatt=False,
                                          polynomial_order=2,
                                          nr_collocation_nodes=50,
+                                         sampling_rule="S",
                                          quadrature_order=3,
                                          nr_pc_mc_samples=10**3,
                                          allow_incomplete=False)
@@ -836,6 +837,7 @@ class TestUncertainty(TestCasePlot):
         self.assertEqual(self.uncertainty.data.arguments["rosenblatt"], False)
         self.assertEqual(self.uncertainty.data.arguments["polynomial_order"], 2)
         self.assertEqual(self.uncertainty.data.arguments["nr_collocation_nodes"], 50)
+        self.assertEqual(self.uncertainty.data.arguments["sampling_rule"], "S")
         self.assertEqual(self.uncertainty.data.arguments["quadrature_order"], 3)
         self.assertEqual(self.uncertainty.data.arguments["nr_pc_mc_samples"],10**3)
         self.assertEqual(self.uncertainty.data.arguments["allow_incomplete"], False)
@@ -847,12 +849,59 @@ class TestUncertainty(TestCasePlot):
         self.assertEqual(data.arguments["rosenblatt"], False)
         self.assertEqual(data.arguments["polynomial_order"], 2)
         self.assertEqual(data.arguments["nr_collocation_nodes"], 50)
+        self.assertEqual(data.arguments["sampling_rule"], "S")
         self.assertEqual(data.arguments["quadrature_order"], 3)
         self.assertEqual(data.arguments["nr_pc_mc_samples"],10**3)
         self.assertEqual(data.arguments["allow_incomplete"], False)
         self.assertEqual(data.arguments["seed"], self.seed)
 
 
+    def test_quantifyPC_without_sampling_rule(self):
+        class OldUncertaintyCalculations(TestingUncertaintyCalculations):
+            def polynomial_chaos(self,
+                                 uncertain_parameters=None,
+                                 method="collocation",
+                                 rosenblatt=False,
+                                 polynomial_order=4,
+                                 nr_collocation_nodes=None,
+                                 quadrature_order=4,
+                                 nr_pc_mc_samples=10**4,
+                                 allow_incomplete=False,
+                                 seed=None):
+                return TestingUncertaintyCalculations.polynomial_chaos(self,
+                                                                       uncertain_parameters=uncertain_parameters,
+                                                                       method=method,
+                                                                       seed=seed)
+
+        parameter_list = [["a", 1, None],
+                          ["b", 2, None]]
+
+        parameters = Parameters(parameter_list)
+        parameters.set_all_distributions(uniform(0.5))
+
+        model = TestingModel1d()
+
+        self.uncertainty = UncertaintyQuantification(model,
+                                                     parameters=parameters,
+                                                     uncertainty_calculations=OldUncertaintyCalculations(model),
+                                                     logger_level="error",
+                                                     logger_filename=None)
+
+        data = self.uncertainty.quantify(method="pc",
+                                         plot=None,
+                                         save=False,
+                                         seed=self.seed)
+        self.assertEqual(data.arguments["function"], "PC")
+        self.assertEqual(data.arguments["sampling_rule"], "M")
+
+        data = self.uncertainty.quantify(method="pc",
+                                         plot=None,
+                                         save=False,
+                                         single=True,
+                                         seed=self.seed)
+        self.assertEqual(data["a"].arguments["function"], "PC")
+
+
 
     def test_no_save(self):
         self.set_up_test_calculations()
@@ -819,6 +819,20 @@ class TestUncertaintyCalculations(unittest.TestCase):
 
 
 
+    def test_create_PCE_collocation_sobol(self):
+        U_hat, distribution, data = \
+            self.uncertainty_calculations.create_PCE_collocation(nr_collocation_nodes=22,
+                                                                 sampling_rule="S")
+
+        self.assertEqual(data.uncertain_parameters, ["a", "b"])
+        self.assertEqual(len(data["TestingModel1d"].evaluations), 22)
+        self.assertIsInstance(U_hat["feature0d"], numpoly.ndpoly)
+        self.assertIsInstance(U_hat["feature1d"], numpoly.ndpoly)
+        self.assertIsInstance(U_hat["feature2d"], numpoly.ndpoly)
+        self.assertIsInstance(U_hat["TestingModel1d"], numpoly.ndpoly)
+
+
+
     def test_create_PCE_collocation_one(self):
         U_hat, distribution, data = self.uncertainty_calculations.create_PCE_collocation("a")
 
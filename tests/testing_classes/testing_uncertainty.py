@@ -12,7 +12,8 @@ class TestingUncertaintyCalculations(UncertaintyCalculations):
                          quadrature_order=4,
                          nr_pc_mc_samples=10**4,
                          allow_incomplete=False,
-                         seed=None):
+                         seed=None,
+                         sampling_rule="M"):
 
         arguments = {}
 
@@ -22,6 +23,7 @@ class TestingUncertaintyCalculations(UncertaintyCalculations):
         arguments["rosenblatt"] = rosenblatt
         arguments["polynomial_order"] = polynomial_order
         arguments["nr_collocation_nodes"] = nr_collocation_nodes
+        arguments["sampling_rule"] = sampling_rule
         arguments["quadrature_order"] = quadrature_order
         arguments["nr_pc_mc_samples"] = nr_pc_mc_samples
         arguments["seed"] = seed